@@ -22,21 +22,28 @@ Version: 2.0.0
 import streamlit as st
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import io
+import errno
 import re
+import shutil
+import threading
+import multiprocessing
 import zipfile
 import tempfile
-import glob
 import numpy as np
-import plotly.graph_objects as go
-from stl import mesh
+# plotly, numpy-stl, trimesh and pymeshlab are imported inside the functions that
+# render or simplify meshes, so the downloader and gallery start without paying for them
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse
-import trimesh
-import pymeshlab
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple, Any
 
+import mesh_loader
+
 # Configuration settings for the application
 @dataclass
 class AppConfig:
@@ -47,6 +54,27 @@ class AppConfig:
     image_extensions: List[str] = None
     # Default category name for uncategorized models
     default_category: str = "Uncategorized"
+    # Size of each chunk read from the HTTP response (1 MiB)
+    download_chunk_size: int = 1 << 20
+    # Archives larger than this are spilled to a temporary file instead of memory (64 MiB)
+    spool_max_size: int = 64 << 20
+    # Minimum number of bytes between download progress bar updates (1 MiB)
+    progress_update_interval: int = 1 << 20
+    # Maximum number of models fetched concurrently in batch mode
+    max_concurrent_downloads: int = 5
+    # Size of each byte range fetched when a single download is split into parts (10 MiB)
+    download_part_size: int = 10 << 20
+    # Number of byte ranges fetched in parallel for a single download
+    download_segments: int = 4
+    # Upper bound on the number of threads used to extract ZIP members
+    max_extract_workers: int = 8
+    # Default triangle budget for the 3D preview; denser meshes are decimated to it
+    preview_max_faces: int = 100_000
+    # Maximum number of characters of a README that are loaded and rendered
+    readme_max_chars: int = 64 * 1024
+    # Number of models whose info is kept cached. The gallery looks up every model on each
+    # rerun, so this must exceed the collection size or the cache evicts itself every pass
+    model_info_cache_size: int = 4096
     
     def __post_init__(self):
         if self.model_extensions is None:
@@ -57,15 +85,39 @@ class AppConfig:
 # Create a global config object
 config = AppConfig()
 
+# Lowercase extension sets for constant-time membership checks during directory scans
+_MODEL_EXT_SET = frozenset(ext.lower() for ext in config.model_extensions)
+_IMAGE_EXT_TUPLE = tuple(ext.lower() for ext in config.image_extensions)
+
+# Precompiled patterns for URL validation and thing ID extraction
+# thing: must appear in the path, not in a query string such as /search?q=thing:123
+_URL_RE = re.compile(r'^https?://(www\.)?thingiverse\.com/[^?#]*thing:\d+')
+_THING_ID_RE = re.compile(r'thing:(\d+)')
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Shared HTTP session so connections to Thingiverse are kept alive and reused across requests.
+# The pool is large enough for concurrent batch downloads and byte-range segments.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "thingiverse-downloader/2.0.0",
+    # ZIP archives are already compressed, so don't ask the server to compress them again
+    "Accept-Encoding": "identity",
+})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 def is_valid_thingiverse_url(url):
     """Check if the URL is a valid Thingiverse thing URL."""
-    parsed_url = urlparse(url)
-    return (parsed_url.netloc == 'www.thingiverse.com' or 
-            parsed_url.netloc == 'thingiverse.com') and 'thing:' in parsed_url.path
+    return _URL_RE.match(url.strip()) is not None
 
 def extract_thing_id(url):
     """Extract the thing ID from a Thingiverse URL."""
-    match = re.search(r'thing:(\d+)', url)
+    match = _THING_ID_RE.search(url)
     if match:
         return match.group(1)
     return None
@@ -75,83 +127,426 @@ def get_download_url(thing_id):
     download_url = f"https://www.thingiverse.com/thing:{thing_id}/zip"
     return download_url
 
-def download_and_extract(url, extract_path):
-    """Download a ZIP file from URL and extract its contents."""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as temp_file:
-        # Download the file
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+def _allocate_buffer(size):
+    """Create a seekable buffer to download a file of the given size into.
+    
+    Downloads up to ``config.spool_max_size`` are kept in memory; larger ones go to an
+    anonymous temporary file. When the size is known the buffer is grown to it once
+    up front instead of chunk by chunk.
+    
+    Args:
+        size (int): Expected size of the download in bytes, or 0 if unknown
+    """
+    if size > config.spool_max_size:
+        buffer = tempfile.TemporaryFile(buffering=0)
+        _preallocate(buffer, size)
+        return buffer
+    
+    buffer = io.BytesIO()
+    if size > 0:
+        buffer.seek(size - 1)
+        buffer.write(b"\0")
+        buffer.seek(0)
+    return buffer
+
+def _stream_to_buffer(response, progress_callback=None):
+    """Stream an HTTP response body into a seekable buffer.
+
+    The body is kept in memory while it is small and rolled over to an anonymous
+    temporary file once it grows past ``config.spool_max_size``.
+    """
+    total_size = int(response.headers.get('content-length', 0))
+    buffer = _allocate_buffer(total_size)
+    downloaded_size = 0
+    reported_size = 0
+    for chunk in response.iter_content(chunk_size=config.download_chunk_size):
+        if not chunk:  # Filter out keep-alive chunks
+            continue
+        buffer.write(chunk)
+        downloaded_size += len(chunk)
+        if isinstance(buffer, io.BytesIO) and downloaded_size > config.spool_max_size:
+            spilled = tempfile.TemporaryFile(buffering=0)
+            spilled.write(buffer.getbuffer())
+            buffer = spilled
         
-        # Write to temporary file
-        for chunk in response.iter_content(chunk_size=8192):
-            temp_file.write(chunk)
+        # Report progress, throttled so Streamlit re-renders don't dominate the loop
+        if progress_callback and downloaded_size - reported_size >= config.progress_update_interval:
+            reported_size = downloaded_size
+            progress_callback(downloaded_size, total_size)
+    
+    # Drop any preallocated space the server did not fill
+    buffer.truncate(downloaded_size)
+    buffer.seek(0)
+    if progress_callback:
+        progress_callback(downloaded_size, total_size)
+    return buffer
+
+def _download_to_buffer(url, progress_callback=None, segmented=False):
+    """Download url into a seekable buffer, optionally as parallel byte ranges."""
+    if segmented:
+        total_size = get_content_length(url)
+        if total_size >= 2 * config.download_part_size:
+            buffer = _allocate_buffer(total_size)
+            if download_ranges(url, buffer, total_size, progress_callback):
+                buffer.seek(0)
+                return buffer
+            buffer.close()
+    
+    response = _SESSION.get(url, stream=True)
+    response.raise_for_status()  # Raise an exception for HTTP errors
+    return _stream_to_buffer(response, progress_callback)
+
+def _member_path(extract_path, filename):
+    """Resolve where a ZIP member should be written, sanitized like ZipFile.extractall.
+    
+    Absolute paths, drive letters and '.'/'..' components are dropped rather than
+    rejected, so '../x' and '/x' land at 'x' inside extract_path. Returns None only for
+    names with nothing left, which extractall would treat as extract_path itself.
+    """
+    arcname = filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    arcname = os.path.sep.join(part for part in arcname.split(os.path.sep)
+                               if part not in ('', os.path.curdir, os.path.pardir))
+    if os.path.sep == '\\':
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    if not arcname:
+        return None
+    return os.path.normpath(os.path.join(extract_path, arcname))
+
+def _extract_one(zip_ref, info, target, lock):
+    """Extract a single non-empty ZIP member to target, whose directory already exists."""
+    # ZipFile is not safe to open members from concurrently, so only opening is serialized;
+    # inflating and writing the data runs in parallel
+    with lock:
+        src = zip_ref.open(info)
+    # Copy with a buffer sized to the member (capped at one chunk) straight into an
+    # unbuffered file, skipping the intermediate buffering layers extractall goes through
+    with src, open(target, 'wb', buffering=0) as dst:
+        _preallocate(dst, info.file_size)
+        shutil.copyfileobj(src, dst, min(info.file_size, config.download_chunk_size))
+
+def extract_zip(zip_ref, extract_path):
+    """Extract all members of an open ZipFile using a pool of threads.
+    
+    Thingiverse packages usually contain many small images and models, so
+    extracting members concurrently overlaps their decompression and disk writes.
+    
+    Args:
+        zip_ref (zipfile.ZipFile): Open archive to extract
+        extract_path (str): Directory to extract the files into
+    """
+    directories = set()
+    empty_files = []
+    members = []
+    for info in zip_ref.infolist():
+        target = _member_path(extract_path, info.filename)
+        if target is None:
+            continue
+        if info.is_dir():
+            directories.add(target)
+            continue
+        directories.add(os.path.dirname(target))
+        # Empty files have nothing to inflate, so there is no need to open the member
+        if info.file_size == 0:
+            empty_files.append(target)
+        else:
+            members.append((info, target))
+    
+    # Create every directory up front, once, instead of once per member in the workers
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+    for target in empty_files:
+        open(target, 'wb').close()
+    
+    lock = threading.Lock()
+    max_workers = min(config.max_extract_workers, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda member: _extract_one(zip_ref, *member, lock), members))
+
+def download_and_extract(url, extract_path, progress_callback=None, segmented=False):
+    """Download a ZIP file from URL and extract its contents.
+    
+    The archive is extracted straight from the downloaded buffer, so it is never
+    written to disk as a separate file and its central directory is parsed only once.
+    
+    Args:
+        url (str): URL of the ZIP file
+        extract_path (str): Directory to extract the files into
+        progress_callback (callable, optional): Called with (downloaded_size, total_size)
+            in bytes while downloading; total_size is 0 if the server doesn't report it.
+            Once the download is complete it is called with downloaded_size == total_size
+            before extraction starts, even if the size wasn't known
+        segmented (bool): Fetch large files as parallel byte ranges when the server
+            supports it
+            
+    Returns:
+        bool: True if the archive was extracted, False if the download was not a valid ZIP
+    """
+    with _download_to_buffer(url, progress_callback, segmented) as buffer:
+        if progress_callback:
+            size = buffer.seek(0, io.SEEK_END)
+            buffer.seek(0)
+            progress_callback(size, size)
+        try:
+            with zipfile.ZipFile(buffer) as zip_ref:
+                extract_zip(zip_ref, extract_path)
+        except zipfile.BadZipFile:
+            return False
+    
+    # Re-extracting over existing files doesn't change the directory's mtime, so bump
+    # it explicitly; cached model info is keyed on it
+    os.utime(extract_path)
+    return True
+
+def _preallocate(file, size):
+    """Reserve the final size of a file before writing it.
+    
+    Allocating the space once lets the filesystem lay the file out in as few extents
+    as possible instead of extending it chunk by chunk.
+    """
+    if size <= 0:
+        return
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            file.flush()
+            os.posix_fallocate(file.fileno(), 0, size)
+            return
+        except OSError as e:
+            # Only fall back when the filesystem can't preallocate; anything else, such as
+            # ENOSPC, is a real failure and must not be hidden behind a sparse file
+            if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    file.truncate(size)
+
+def get_content_length(url):
+    """Get the size of a remote file from a HEAD request.
+    
+    Args:
+        url (str): URL of the file
         
-        temp_file_path = temp_file.name
+    Returns:
+        int: Size of the file in bytes, or 0 if the server does not report it
+    """
+    response = _SESSION.head(url, allow_redirects=True)
+    if not response.ok:
+        return 0
+    return int(response.headers.get('content-length', 0))
+
+def parts_generator(size, part_size=None):
+    """Split a file of the given size into inclusive (start, end) byte ranges."""
+    part_size = part_size or config.download_part_size
+    for start in range(0, size, part_size):
+        yield start, min(start + part_size, size) - 1
+
+def _download_range(url, file, lock, start, end):
+    """Download one byte range of url into file at the matching offset.
     
-    # Extract the ZIP file
-    try:
-        with zipfile.ZipFile(temp_file_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
-        os.unlink(temp_file_path)  # Delete the temporary file
-        return True
-    except zipfile.BadZipFile:
-        os.unlink(temp_file_path)  # Delete the temporary file
+    Returns:
+        bool: False if the server ignored the Range header, True otherwise
+    """
+    response = _SESSION.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True)
+    response.raise_for_status()
+    if response.status_code != 206:
+        response.close()
         return False
+    
+    offset = start
+    for chunk in response.iter_content(chunk_size=config.download_chunk_size):
+        with lock:
+            file.seek(offset)
+            file.write(chunk)
+        offset += len(chunk)
+    return True
 
-def find_thumbnail(directory, thing_id):
+def download_ranges(url, file, size, progress_callback=None):
+    """Download url into file using parallel HTTP range requests.
+    
+    Servers often throttle each connection, so fetching several byte ranges at once
+    gets closer to the available bandwidth than a single stream.
+    
+    Args:
+        url (str): URL of the file to download
+        file: Writable, seekable binary file object
+        size (int): Total size of the file in bytes
+        progress_callback (callable, optional): Called with (downloaded_size, size)
+            in bytes each time a part completes
+            
+    Returns:
+        bool: True if the whole file was downloaded, False if the server does not
+            support range requests and the caller should fall back to a single stream
+    """
+    lock = threading.Lock()
+    downloaded_size = 0
+    with ThreadPoolExecutor(max_workers=config.download_segments) as executor:
+        futures = {executor.submit(_download_range, url, file, lock, start, end): end - start + 1
+                   for start, end in parts_generator(size)}
+        for future in as_completed(futures):
+            if not future.result():
+                for pending in futures:
+                    pending.cancel()
+                return False
+            
+            downloaded_size += futures[future]
+            if progress_callback:
+                progress_callback(downloaded_size, size)
+    return True
+
+@st.cache_data(show_spinner=False, ttl=300)
+def find_thumbnail(directory, thing_id, mtime):
     """Find the thumbnail image for a specific thing ID.
     
     Args:
         directory (str): The directory to search for thumbnails
         thing_id (str): The thing ID to help find specific thumbnails
+        mtime (float): Modification time of the directory, used to invalidate the cache
         
     Returns:
         str or None: Path to the thumbnail image if found, None otherwise
     """
-    # Define search strategies in order of preference
-    search_strategies = [
-        # Strategy 1: Check images directory first
-        lambda: find_in_images_dir(directory),
-        # Strategy 2: Look for files with _Thumbnail in the name
-        lambda: find_first_match(directory, f"*_Thumbnail*.png"),
-        # Strategy 3: Look for files with thing_id and Thumbnail
-        lambda: find_first_match(directory, f"*{thing_id}*Thumbnail*.png"),
-        # Strategy 4: Any PNG file as fallback
-        lambda: find_first_match(directory, "*.png")
-    ]
+    # Images in the 'images' subdirectory are preferred over everything else
+    thumbnail = find_in_images_dir(directory)
+    if thumbnail:
+        return thumbnail
     
-    # Try each strategy in order until we find a thumbnail
-    for strategy in search_strategies:
-        thumbnail = strategy()
-        if thumbnail:
-            return thumbnail
+    # Score every image in a single pass over the directory and keep the best one:
+    # 3 - thumbnail for this thing ID, 2 - any thumbnail, 1 - any PNG as fallback
+    best_name = None
+    best_score = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                lower_name = name.lower()
+                if name.startswith('.') or not lower_name.endswith(_IMAGE_EXT_TUPLE):
+                    continue
+                if "Thumbnail" in name:
+                    score = 3 if thing_id and thing_id in name else 2
+                elif lower_name.endswith(".png"):
+                    score = 1
+                else:
+                    continue
+                # Ties go to the alphabetically first name, as the sorted glob results did
+                if score > best_score or (score == best_score and name < best_name):
+                    best_name = name
+                    best_score = score
+    except OSError:
+        # The directory vanished or can't be read; like glob did, treat it as empty
+        return None
+    
+    if best_name:
+        return os.path.join(directory, best_name)
     
     return None
 
 def find_in_images_dir(directory):
     """Find the first image in the 'images' subdirectory."""
     images_dir = os.path.join(directory, "images")
-    if not os.path.exists(images_dir):
+    if not os.path.isdir(images_dir):
+        return None
+    
+    # A single listing covers every image extension
+    try:
+        with os.scandir(images_dir) as entries:
+            image_files = [entry.name for entry in entries
+                           if not entry.name.startswith('.') and entry.name.lower().endswith(_IMAGE_EXT_TUPLE)]
+    except OSError:
         return None
-        
-    image_files = []
-    for ext in [".png", ".jpg", ".jpeg"]:
-        image_files.extend(glob.glob(os.path.join(images_dir, f"*{ext}")))
     
     if image_files:
-        image_files.sort()
-        return image_files[0]
+        return os.path.join(images_dir, min(image_files))
     
     return None
 
-def find_first_match(directory, pattern):
-    """Find the first file matching a glob pattern."""
-    matches = glob.glob(os.path.join(directory, pattern))
-    if matches:
-        matches.sort()
-        return matches[0]
+@st.cache_data(show_spinner=False, ttl=10)
+def list_categories(downloads_dir: str) -> List[str]:
+    """List the category directories inside the downloads directory.
     
-    return None
+    Args:
+        downloads_dir (str): Root directory holding one subdirectory per category
+        
+    Returns:
+        List[str]: Category names, or an empty list if the directory doesn't exist
+    """
+    if not os.path.isdir(downloads_dir):
+        return []
+    # DirEntry knows each entry's type from the directory read, so only symlinks need a
+    # stat; like os.path.isdir, symlinked categories count
+    try:
+        with os.scandir(downloads_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+def _dir_stats(path: str) -> Tuple[int, int]:
+    """Count the files under a directory and their total size in bytes.
+    
+    Uses os.scandir so entries are classified from the directory read and each file
+    costs a single stat, without building os.walk's intermediate lists.
+    """
+    file_count = 0
+    total_bytes = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total_bytes += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        sub_count, sub_bytes = _dir_stats(entry.path)
+                        file_count += sub_count
+                        total_bytes += sub_bytes
+                except OSError:
+                    pass
+    except OSError:
+        # Vanished or unreadable directories are skipped, as os.walk did
+        pass
+    return file_count, total_bytes
+
+@st.cache_data(show_spinner=False, ttl=60)
+def scan_downloads(downloads_dir: str) -> Dict[str, List[Tuple[str, str, int, int, float]]]:
+    """Index every model in the downloads directory in a single traversal.
+    
+    The result is shared by the gallery, the sidebar statistics and the collection
+    export, so a rerun doesn't walk the whole collection again.
+    
+    Args:
+        downloads_dir (str): Root directory holding one subdirectory per category
+        
+    Returns:
+        Dict[str, List[Tuple[str, str, int, int, float]]]: Mapping of category name to
+            (model_name, model_path, file_count, total_bytes, mtime) tuples
+    """
+    index = {}
+    if not os.path.isdir(downloads_dir):
+        return index
+    
+    try:
+        with os.scandir(downloads_dir) as categories:
+            for category in categories:
+                if not category.is_dir():
+                    continue
+                models = []
+                try:
+                    with os.scandir(category.path) as model_dirs:
+                        for model_dir in model_dirs:
+                            try:
+                                if not model_dir.is_dir():
+                                    continue
+                                mtime = model_dir.stat().st_mtime
+                            except OSError:
+                                # Deleted while we were scanning
+                                continue
+                            file_count, total_bytes = _dir_stats(model_dir.path)
+                            models.append((model_dir.name, model_dir.path, file_count, total_bytes, mtime))
+                except OSError:
+                    continue
+                index[category.name] = models
+    except OSError:
+        pass
+    return index
 
 def downloader_page(downloads_dir):
     st.title("Download Thingiverse Models")
@@ -179,11 +574,7 @@ def downloader_page(downloads_dir):
     # Category selection
     # Get existing categories from the directory structure
     categories = ["Uncategorized"]  # Default category
-    if os.path.exists(downloads_dir):
-        for item in os.listdir(downloads_dir):
-            item_path = os.path.join(downloads_dir, item)
-            if os.path.isdir(item_path) and item != "Uncategorized":
-                categories.append(item)
+    categories.extend(category for category in list_categories(downloads_dir) if category != "Uncategorized")
     
     # Add option to create a new category
     categories.append("+ Create new category")
@@ -237,29 +628,37 @@ def downloader_page(downloads_dir):
                 # Create a progress bar for overall progress
                 overall_progress = st.progress(0, text="Overall progress...")
                 
-                # Download each valid URL
-                for i, (url, thing_id) in enumerate(valid_urls):
-                    # Create a specific directory for this model within the category
-                    model_dir = os.path.join(category_dir, f"thing_{thing_id}")
-                    os.makedirs(model_dir, exist_ok=True)
-                    
-                    # Get download URL
-                    download_url = get_download_url(thing_id)
-                    
-                    # Update progress
-                    progress_text = f"Downloading model {i+1}/{len(valid_urls)}: thing_{thing_id}..."
-                    st.write(progress_text)
+                # Download the models concurrently, bounded to a polite number of connections.
+                # Streamlit elements may only be updated from the script thread, so workers just
+                # download and extract while results are reported here as they complete.
+                with ThreadPoolExecutor(max_workers=config.max_concurrent_downloads) as executor:
+                    futures = {}
+                    for url, thing_id in valid_urls:
+                        # Create a specific directory for this model within the category
+                        model_dir = os.path.join(category_dir, f"thing_{thing_id}")
+                        os.makedirs(model_dir, exist_ok=True)
+                        
+                        # Get download URL and queue the download
+                        download_url = get_download_url(thing_id)
+                        futures[executor.submit(download_and_extract, download_url, model_dir)] = thing_id
                     
-                    try:
-                        # Download and extract
-                        download_and_extract(download_url, model_dir)
-                        st.success(f"Successfully downloaded and extracted thing_{thing_id}.")
-                    except Exception as e:
-                        st.error(f"Error downloading thing_{thing_id}: {str(e)}")
+                    st.write(f"Downloading {len(valid_urls)} models, up to {config.max_concurrent_downloads} at a time...")
                     
-                    # Update overall progress
-                    overall_progress.progress((i+1)/len(valid_urls), text=f"Overall progress: {i+1}/{len(valid_urls)} complete")
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        thing_id = futures[future]
+                        try:
+                            future.result()
+                            st.success(f"Successfully downloaded and extracted thing_{thing_id}.")
+                        except Exception as e:
+                            st.error(f"Error downloading thing_{thing_id}: {str(e)}")
+                        
+                        # Update overall progress
+                        overall_progress.progress(completed/len(valid_urls), text=f"Overall progress: {completed}/{len(valid_urls)} complete")
                 
+                # Drop the cached model listings so the browser picks up the new downloads. Per-model
+                # caches are keyed on directory mtime, which extraction bumps, so they stay valid
+                scan_downloads.clear()
+                list_categories.clear()
                 st.success("Batch download complete!")
                 
         else:
@@ -276,74 +675,60 @@ def downloader_page(downloads_dir):
             if not thing_id:
                 st.error("Could not extract thing ID from the URL.")
                 return
-        
-        # Create a specific directory for this model within the category
-        model_dir = os.path.join(category_dir, f"thing_{thing_id}")
-        os.makedirs(model_dir, exist_ok=True)
-        
-        # Get download URL
-        download_url = get_download_url(thing_id)
-        
-        # Create a progress bar
-        progress_text = "Downloading model..."
-        progress_bar = st.progress(0, text=progress_text)
-        
-        try:
-            # Send a GET request to the download URL
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
             
-            # Get the total file size if available
-            total_size = int(response.headers.get('content-length', 0))
-            
-            # Generate a filename based on the thing ID
-            zip_filename = os.path.join(model_dir, f"thing_{thing_id}.zip")
-            
-            # Download the file with progress updates
-            downloaded_size = 0
-            with open(zip_filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:  # Filter out keep-alive chunks
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        # Update progress bar
-                        if total_size > 0:
-                            progress = min(downloaded_size / total_size, 1.0)
-                            progress_bar.progress(progress, text=f"{progress_text} {downloaded_size / (1024 * 1024):.1f} MB")
+            # Create a specific directory for this model within the category
+            model_dir = os.path.join(category_dir, f"thing_{thing_id}")
+            os.makedirs(model_dir, exist_ok=True)
             
-            # Extract the ZIP file
-            progress_bar.progress(1.0, text="Extracting files...")
+            # Get download URL
+            download_url = get_download_url(thing_id)
             
-            with zipfile.ZipFile(zip_filename, 'r') as zip_ref:
-                zip_ref.extractall(model_dir)
+            # Create a progress bar
+            progress_text = "Downloading model..."
+            progress_bar = st.progress(0, text=progress_text)
             
-            # Clean up the ZIP file
-            os.remove(zip_filename)
+            def show_progress(downloaded_size, total_size):
+                if total_size > 0 and downloaded_size >= total_size:
+                    progress_bar.progress(1.0, text="Extracting files...")
+                elif total_size > 0:
+                    progress = downloaded_size / total_size
+                    progress_bar.progress(progress, text=f"{progress_text} {downloaded_size / (1024 * 1024):.1f} MB")
             
-            progress_bar.empty()
-            
-            # Display success message
-            st.success(f"Files successfully downloaded and extracted to {model_dir}")
-            
-            # Add a simple message about where to find the model
-            st.info(f"You can find your downloaded model in the Browser tab under the '{selected_category}' category.")
-            
-        except requests.exceptions.RequestException as e:
-            progress_bar.empty()
-            st.error(f"Failed to download: {str(e)}")
-        except zipfile.BadZipFile:
-            progress_bar.empty()
-            st.error("Downloaded file is not a valid ZIP file")
-        except Exception as e:
-            progress_bar.empty()
-            st.error(f"An error occurred: {str(e)}")
+            try:
+                # Download and extract through the same path as batch downloads; large files
+                # are fetched as parallel byte ranges when the server supports it
+                if not download_and_extract(download_url, model_dir, show_progress, segmented=True):
+                    raise zipfile.BadZipFile()
+                
+                progress_bar.empty()
+                
+                # Drop the cached model listings so the browser picks up the new download
+                scan_downloads.clear()
+                list_categories.clear()
+                
+                # Display success message
+                st.success(f"Files successfully downloaded and extracted to {model_dir}")
+                
+                # Add a simple message about where to find the model
+                st.info(f"You can find your downloaded model in the Browser tab under the '{selected_category}' category.")
+                
+            except requests.exceptions.RequestException as e:
+                progress_bar.empty()
+                st.error(f"Failed to download: {str(e)}")
+            except zipfile.BadZipFile:
+                progress_bar.empty()
+                st.error("Downloaded file is not a valid ZIP file")
+            except Exception as e:
+                progress_bar.empty()
+                st.error(f"An error occurred: {str(e)}")
 
-def find_readme(directory: str) -> Optional[str]:
+@st.cache_data(show_spinner=False, ttl=300)
+def find_readme(directory: str, mtime: float) -> Optional[str]:
     """Find README.txt or similar files in the directory.
     
     Args:
         directory (str): Directory to search for README files
+        mtime (float): Modification time of the directory, used to invalidate the cache
         
     Returns:
         Optional[str]: Path to the README file if found, None otherwise
@@ -373,196 +758,200 @@ def find_readme(directory: str) -> Optional[str]:
     
     return None
 
-def get_model_info(model_path: str, model_name: str) -> Dict[str, Any]:
+@st.cache_data(show_spinner=False, max_entries=config.model_info_cache_size)
+def get_model_info(model_path: str, model_name: str, mtime: float,
+                   category: Optional[str] = None) -> Dict[str, Any]:
     """Get comprehensive information about a 3D model.
     
     Args:
         model_path (str): Path to the model directory
         model_name (str): Name of the model (usually directory name)
+        mtime (float): Modification time of the model directory, used to invalidate the cache
+        category (Optional[str]): Category the model is stored under, if known
         
     Returns:
         Dict[str, Any]: Dictionary containing model information including:
             - name: Model name
+            - category: Category the model is stored under
             - path: Path to model directory
             - thing_id: Thingiverse ID if available
-            - thumbnail_path: Path to thumbnail if found
+            - thumbnail_path: Path to thumbnail if found and present on disk
             - model_files: List of 3D model files (name, path) tuples
             - model_count: Number of 3D model files
             - readme_path: Path to README file if found
             - readme_content: Content of README file
+            - search_text: Lowercased name, thing ID and README content for searching
     """
     # Extract thing ID from the directory name
-    thing_id_match = re.search(r'(\d+)', model_name)
+    thing_id_match = _DIGITS_RE.search(model_name)
     thing_id = thing_id_match.group(1) if thing_id_match else None
     
     # Find thumbnail if available
-    thumbnail_path = find_thumbnail(model_path, thing_id or "")
+    thumbnail_path = find_thumbnail(model_path, thing_id or "", mtime)
+    # Check the thumbnail once here so the gallery cards don't stat it on every rerun
+    if thumbnail_path and not os.path.exists(thumbnail_path):
+        thumbnail_path = None
     
     # Find all 3D model files using global config
-    model_files = find_model_files(model_path)
+    model_files = find_model_files(model_path, mtime)
     
     # Get README content
-    readme_path, readme_content = get_readme_content(model_path)
+    readme_path, readme_content = get_readme_content(model_path, mtime)
     
     # Build comprehensive model info dictionary
     return {
         "name": model_name,
+        "category": category,
         "path": model_path,
         "thing_id": thing_id,
         "thumbnail_path": thumbnail_path,
         "model_files": model_files,
         "model_count": len(model_files),
         "readme_path": readme_path,
-        "readme_content": readme_content
+        "readme_content": readme_content,
+        # Lowercased once here so searching doesn't redo it on every keystroke; fields are
+        # joined with newlines so a single-line query can't match across two of them
+        "search_text": "\n".join([model_name, thing_id or "", readme_content or ""]).lower()
     }
 
-def find_model_files(directory: str) -> List[Tuple[str, str]]:
+@st.cache_data(show_spinner=False, ttl=300)
+def find_model_files(directory: str, mtime: float) -> List[Tuple[str, str]]:
     """Find all 3D model files in a directory.
     
     Args:
         directory (str): Directory to search for model files
+        mtime (float): Modification time of the directory, used to invalidate the cache
         
     Returns:
         List[Tuple[str, str]]: List of (relative_path, absolute_path) tuples for model files
     """
     model_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            file_ext = os.path.splitext(file)[1].lower()
-            if file_ext in config.model_extensions:
-                abs_path = os.path.join(root, file)
-                rel_path = os.path.relpath(abs_path, directory)
-                model_files.append((rel_path, abs_path))
+    # Walk the tree with an explicit stack; DirEntry caches the entry type from the
+    # directory read, so classifying entries needs no extra stat calls
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in _MODEL_EXT_SET:
+                        rel_path = os.path.relpath(entry.path, directory)
+                        model_files.append((rel_path, entry.path))
+        except OSError:
+            # Vanished or unreadable directories are skipped, as os.walk did
+            continue
+    model_files.sort()
     return model_files
 
-def get_readme_content(directory: str) -> Tuple[Optional[str], str]:
+@st.cache_data(show_spinner=False, ttl=300)
+def get_readme_content(directory: str, mtime: float) -> Tuple[Optional[str], str]:
     """Get README file path and content.
     
     Args:
         directory (str): Directory to search for README file
+        mtime (float): Modification time of the directory, used to invalidate the cache
         
     Returns:
         Tuple[Optional[str], str]: (readme_path, readme_content)
     """
-    readme_path = find_readme(directory)
+    readme_path = find_readme(directory, mtime)
     readme_content = ""
     
     if readme_path:
         try:
-            with open(readme_path, 'r', encoding='utf-8', errors='replace') as f:
-                readme_content = f.read()
+            # Some packages ship multi-MB manuals as their README; loading and rendering all of it
+            # stalls the page, so only the beginning is read in one buffered call
+            with open(readme_path, 'r', encoding='utf-8', errors='replace', buffering=65536) as f:
+                readme_content = f.read(config.readme_max_chars)
+                if f.read(1):
+                    readme_content += "\n\n… (truncated, open the file for the full content)"
         except Exception as e:
             readme_content = f"Error reading README: {str(e)}"
     
     return readme_path, readme_content
 
-def display_model_details(model_info):
-    """Display detailed information for a model"""
-    st.write(f"### {model_info['name']}")
+@st.cache_resource
+def _mesh_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all sessions for parsing and simplifying meshes.
     
-    # Create columns for thumbnail and basic info
-    col1, col2 = st.columns([1, 2])
+    Workers are spawned rather than forked: forking the multi-threaded Streamlit server can
+    deadlock the child on locks held by other threads. A spawned worker imports this script
+    as __mp_main__, which only defines functions since main() is guarded.
+    """
+    return ProcessPoolExecutor(max_workers=os.cpu_count(),
+                               mp_context=multiprocessing.get_context("spawn"))
+
+def _run_in_pool(fn, *args):
+    """Run fn(*args) in the shared mesh pool and return its result."""
+    try:
+        return _mesh_pool().submit(fn, *args).result()
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory). Running the job here instead would move
+        # that into the server process, so start a fresh pool next time and let the caller
+        # fall back
+        _mesh_pool().shutdown(wait=False)
+        _mesh_pool.clear()
+        raise
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _parsed_mesh(path: str, mtime: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a mesh file once, in the shared process pool so parsing doesn't hold the GIL
+    and concurrent sessions can load models on separate cores.
     
-    with col1:
-        if model_info['thumbnail_path'] and os.path.exists(model_info['thumbnail_path']):
-            st.image(model_info['thumbnail_path'], use_column_width=True)
-        else:
-            st.info("No preview image available")
+    The arrays are shared between sessions rather than copied on each hit, so they are
+    made read-only.
     
-    with col2:
-        st.write(f"**Thing ID:** {model_info['thing_id'] if model_info['thing_id'] else 'Unknown'}")
-        st.write(f"**3D Model Files:** {model_info['model_count']}")
-        st.write(f"**Location:** {model_info['path']}")
-    
-    # Create tabs for file browser and 3D model viewer
-    file_browser_tab, model_viewer_tab = st.tabs(["Files", "3D Model Viewer"])
-    
-    with file_browser_tab:
-        # Display files in a more organized way
-        st.write("#### Files:")
-        for file in sorted(os.listdir(model_info['path'])):
-            file_path = os.path.join(model_info['path'], file)
-            if os.path.isdir(file_path):
-                st.markdown(f"📁 **{file}/**")
-                # List files in subdirectory
-                subfiles = os.listdir(file_path)
-                for subfile in sorted(subfiles):
-                    st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;📄 {subfile}")
-            else:
-                st.markdown(f"📄 {file}")
+    Args:
+        path (str): Path to the mesh file
+        mtime (float): Modification time of the file, used to invalidate the cache
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: See mesh_loader.load_mesh
+    """
+    vertices, faces = _run_in_pool(mesh_loader.load_mesh, path)
+    vertices.setflags(write=False)
+    faces.setflags(write=False)
+    return vertices, faces
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _mesh_preview(path: str, mtime: float, target_faces: int) -> Tuple[np.ndarray, ...]:
+    """Plotly arrays for a mesh reduced to at most target_faces triangles."""
+    vertices, faces = _parsed_mesh(path, mtime)
+    # Plotly slows down badly past a few hundred thousand triangles
+    if len(faces) > target_faces:
+        vertices, faces = _run_in_pool(mesh_loader.decimate_mesh, vertices, faces, target_faces)
+    return mesh_loader.plot_arrays(vertices, faces)
+
+def _load_mesh(path: str, mtime: float, max_faces: int) -> Tuple[np.ndarray, ...]:
+    """Load a mesh for display, decimated to at most max_faces triangles.
     
-    with model_viewer_tab:
-        if model_info['model_files']:
-            # Let user select which 3D model to view
-            selected_model = st.selectbox("Select 3D model file to view", 
-                                       [name for name, _ in model_info['model_files']])
-            
-            # Get the full path of the selected model
-            selected_model_path = next((path for name, path in model_info['model_files'] if name == selected_model), None)
-            
-            if selected_model_path:
-                # Display file format
-                file_ext = os.path.splitext(selected_model_path)[1].lower()
-                st.write(f"File format: {file_ext[1:].upper()}")
-                
-                try:
-                    # Load the 3D model file based on its format
-                    if file_ext == '.stl':
-                        # Use numpy-stl for STL files
-                        your_mesh = mesh.Mesh.from_file(selected_model_path)
-                    
-                        # Get the vertices and faces for plotting
-                        x = your_mesh.x.flatten()
-                        y = your_mesh.y.flatten()
-                        z = your_mesh.z.flatten()
-                        
-                        # Create a 3D mesh plot
-                        fig = go.Figure(data=[
-                            go.Mesh3d(
-                                x=x,
-                                y=y,
-                                z=z,
-                                color='lightblue',
-                                opacity=0.8,
-                            )
-                        ])
-                    else:  # .obj or .3mf
-                        # Display a message about limited preview support
-                        st.info(f"Preview for {file_ext[1:].upper()} files is currently only available for download. You can download the file to view it in your preferred 3D model viewer.")
-                        # Skip the 3D visualization for non-STL files
-                        fig = None
-                    
-                    # Only update and display the plot if fig is not None (for STL files)
-                    if fig is not None:
-                        # Update the layout for better visualization
-                        fig.update_layout(
-                            scene=dict(
-                                xaxis=dict(showticklabels=False),
-                                yaxis=dict(showticklabels=False),
-                                zaxis=dict(showticklabels=False),
-                            ),
-                            margin=dict(l=0, r=0, b=0, t=0),
-                            scene_camera=dict(
-                                eye=dict(x=1.5, y=1.5, z=1.5)
-                            ),
-                            height=500,
-                        )
-                        
-                        # Display the plot in Streamlit
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Add a download button for the 3D model file
-                    with open(selected_model_path, "rb") as file:
-                        st.download_button(
-                            label=f"Download {file_ext[1:].upper()} file",
-                            data=file,
-                            file_name=os.path.basename(selected_model_path),
-                            mime="application/octet-stream"
-                        )
-                except Exception as e:
-                    st.error(f"Error loading 3D model file: {str(e)}")
-        else:
-            st.info("No 3D model files found in this model.")
+    Args:
+        path (str): Path to the mesh file
+        mtime (float): Modification time of the file, used to invalidate the cache
+        max_faces (int): Meshes with more triangles than this are decimated to it
+        
+    Returns:
+        Tuple[np.ndarray, ...]: See mesh_loader.plot_arrays
+    """
+    _, faces = _parsed_mesh(path, mtime)
+    # A mesh already within the budget looks the same at every slider position, so all of
+    # those positions share one cached preview
+    return _mesh_preview(path, mtime, min(max_faces, len(faces)))
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _read_bytes(path: str, mtime: float) -> bytes:
+    """Read a file's bytes once for download buttons, cached until the file changes.
+    
+    bytes are immutable, so every session shares the one cached object; cache_data would
+    hand back a fresh unpickled copy of the whole file on each hit.
+    
+    Args:
+        path (str): Path to the file
+        mtime (float): Modification time of the file, used to invalidate the cache
+    """
+    with open(path, "rb") as file:
+        return file.read()
 
 def browser_page(downloads_dir, selected_model_name=None, selected_category=None):
     st.title("Model Browser")
@@ -583,8 +972,8 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
             if os.path.isdir(category_path):
                 model_path = os.path.join(category_path, selected_model_name)
                 if os.path.exists(model_path):
-                    model_info = get_model_info(model_path, selected_model_name)
-                    model_info['category'] = selected_category  # Add category to model info
+                    model_info = get_model_info(model_path, selected_model_name, os.path.getmtime(model_path),
+                                                selected_category)
                     st.session_state.selected_model = model_info
                     found = True
         
@@ -593,27 +982,27 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
             st.warning(f"Model '{selected_model_name}' not found in the '{selected_category}' category.")
             
         # If no category specified or not found in the specified category, check all categories
-        if not found and os.path.exists(downloads_dir):
-            for category in os.listdir(downloads_dir):
+        if not found:
+            for category in list_categories(downloads_dir):
                 category_path = os.path.join(downloads_dir, category)
-                if os.path.isdir(category_path):
-                    model_path = os.path.join(category_path, selected_model_name)
-                    if os.path.exists(model_path):
-                        model_info = get_model_info(model_path, selected_model_name)
-                        model_info['category'] = category  # Add category to model info
-                        st.session_state.selected_model = model_info
-                        found = True
-                        break
+                model_path = os.path.join(category_path, selected_model_name)
+                if os.path.exists(model_path):
+                    model_info = get_model_info(model_path, selected_model_name, os.path.getmtime(model_path),
+                                                category)
+                    st.session_state.selected_model = model_info
+                    found = True
+                    break
         
         # If still not found, show a general error message
         if not found and selected_model_name:
             st.warning(f"Model '{selected_model_name}' not found in any category.")
     
     # Check if the downloads directory has any subdirectories (categories)
-    if os.path.exists(downloads_dir) and os.listdir(downloads_dir):
-        # Get all subdirectories in the downloads directory (these are categories)
-        categories = [d for d in os.listdir(downloads_dir) 
-                     if os.path.isdir(os.path.join(downloads_dir, d))]
+    if os.path.isdir(downloads_dir):
+        # Index of all models, shared with the sidebar statistics and export; its keys are
+        # the subdirectories of the downloads directory (the categories)
+        downloads_index = scan_downloads(downloads_dir)
+        categories = list(downloads_index)
         
         if categories:
             # If a model is selected, show the detail view instead of the gallery
@@ -633,7 +1022,7 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                 col1, col2 = st.columns([1, 2])
                 
                 with col1:
-                    if model['thumbnail_path'] and os.path.exists(model['thumbnail_path']):
+                    if model['thumbnail_path']:
                         st.image(model['thumbnail_path'], use_column_width=True)
                     else:
                         st.info("No preview image available")
@@ -691,29 +1080,25 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                             st.write(f"File format: {file_ext[1:].upper()}")
                             
                             try:
+                                # Read once for whichever download button below is shown
+                                data_bytes = _read_bytes(selected_model_path, os.path.getmtime(selected_model_path))
+                                
                                 # Load the 3D model file based on its format
                                 if file_ext == '.stl':
+                                    import plotly.graph_objects as go
+                                    from plotly.colors import get_colorscale
+
                                     # Use trimesh for better STL rendering
                                     try:
-                                        # Load the mesh with trimesh for better processing
-                                        tm_mesh = trimesh.load(selected_model_path)
-                                        
-                                        # Center the model and normalize size
-                                        tm_mesh.apply_translation(-tm_mesh.center_mass)
-                                        # Normalize size for consistent display
-                                        scale = 100.0 / max(tm_mesh.extents)
-                                        tm_mesh.apply_scale(scale)
-                                        
-                                        # Get vertices and faces for plotting
-                                        vertices = tm_mesh.vertices
-                                        faces = tm_mesh.faces
+                                        # Let the user trade preview fidelity for rendering speed
+                                        max_faces = st.slider("Preview detail (triangles)", min_value=10_000,
+                                                              max_value=500_000, value=config.preview_max_faces, step=10_000)
                                         
-                                        # Convert to x, y, z arrays for plotly
-                                        i, j, k = faces[:, 0], faces[:, 1], faces[:, 2]
-                                        x, y, z = vertices[:, 0], vertices[:, 1], vertices[:, 2]
-                                        
-                                        # Calculate normals for better lighting
-                                        normals = tm_mesh.face_normals
+                                        # Load the normalized mesh; it is cached, so changing the
+                                        # appearance controls doesn't parse the file again
+                                        x, y, z, i, j, k, intensity = _load_mesh(selected_model_path,
+                                                                      os.path.getmtime(selected_model_path),
+                                                                      max_faces)
                                         
                                         # Create improved 3D mesh with better visual settings
                                         fig = go.Figure(data=[
@@ -721,7 +1106,10 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                                                 x=x, y=y, z=z,
                                                 i=i, j=j, k=k,
                                                 # Use nicer color and lighting
-                                                intensity=z,  # Color based on z height for visual interest
+                                                # Color based on z height for visual interest
+                                                intensity=intensity,
+                                                cmin=0.0,
+                                                cmax=1.0,
                                                 colorscale='Viridis',
                                                 opacity=1.0,
                                                 lighting=dict(
@@ -753,14 +1141,21 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                                     except Exception as e:
                                         st.error(f"Error rendering the STL file: {str(e)}")
                                         # Fallback to the original implementation if trimesh fails
-                                        your_mesh = mesh.Mesh.from_file(selected_model_path)
-                                        x = your_mesh.x.flatten()
-                                        y = your_mesh.y.flatten()
-                                        z = your_mesh.z.flatten()
+                                        # (normals are unused, so don't let numpy-stl recompute them)
+                                        from stl import mesh
+                                        your_mesh = mesh.Mesh.from_file(selected_model_path, calculate_normals=False)
+                                        
+                                        # STL stores every triangle's corners separately; merge the shared
+                                        # corners into an indexed mesh so Plotly gets a third of the vertices
+                                        # and explicit triangles instead of a point cloud to triangulate
+                                        vertices, inverse = np.unique(your_mesh.vectors.reshape(-1, 3),
+                                                                      axis=0, return_inverse=True)
+                                        triangles = inverse.reshape(-1, 3).astype(np.int32, copy=False)
                                         
                                         fig = go.Figure(data=[
                                             go.Mesh3d(
-                                                x=x, y=y, z=z,
+                                                x=vertices[:, 0], y=vertices[:, 1], z=vertices[:, 2],
+                                                i=triangles[:, 0], j=triangles[:, 1], k=triangles[:, 2],
                                                 color='lightblue',
                                                 opacity=0.8,
                                             )
@@ -773,13 +1168,12 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                                     fig = None
                                     
                                     # Add a download button for the model file
-                                    with open(selected_model_path, "rb") as file:
-                                        st.download_button(
-                                            label=f"Download {file_ext[1:].upper()} file",
-                                            data=file,
-                                            file_name=os.path.basename(selected_model_path),
-                                            mime="application/octet-stream"
-                                        )
+                                    st.download_button(
+                                        label=f"Download {file_ext[1:].upper()} file",
+                                        data=data_bytes,
+                                        file_name=os.path.basename(selected_model_path),
+                                        mime="application/octet-stream"
+                                    )
                                     # Return early since we're not showing a 3D visualization
                                     return
                                 
@@ -797,43 +1191,42 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                                     height=600,  # Taller plot for better visibility
                                 )
                                 
-                                # Add user-friendly controls for customizing the model appearance
-                                col1, col2 = st.columns([1, 1])
-                                with col1:
-                                    color_option = st.selectbox(
-                                        "Color Style",
-                                        ["Viridis", "Plasma", "Inferno", "Magma", "Cividis", "Rainbow", "Solid Blue", "Solid Green"]
-                                    )
-                                with col2:
-                                    # Add a slider for opacity
-                                    opacity = st.slider("Opacity", min_value=0.1, max_value=1.0, value=1.0, step=0.1)
-                                
-                                # Update figure based on user selections
-                                if hasattr(fig.data[0], 'intensity') and "Solid" not in color_option:
-                                    fig.data[0].colorscale = color_option.lower()
-                                    fig.data[0].opacity = opacity
-                                elif "Solid Blue" in color_option:
-                                    fig.data[0].colorscale = None
-                                    fig.data[0].intensity = None
-                                    fig.data[0].color = 'royalblue'
-                                    fig.data[0].opacity = opacity
-                                elif "Solid Green" in color_option:
-                                    fig.data[0].colorscale = None
-                                    fig.data[0].intensity = None
-                                    fig.data[0].color = 'mediumseagreen'
-                                    fig.data[0].opacity = opacity
+                                # Add user-friendly controls for customizing the model appearance. They are
+                                # Plotly restyle controls that run in the browser, so changing them neither
+                                # reruns the script nor sends the mesh to the browser again
+                                # plotly.js only knows a few named scales (and matches them case-sensitively),
+                                # so the buttons carry the scales expanded by plotly.py
+                                color_buttons = [
+                                    dict(label=name, method="restyle",
+                                         args=[{"colorscale": [get_colorscale(name)], "showscale": [True]}])
+                                    for name in ["Viridis", "Plasma", "Inferno", "Magma", "Cividis", "Rainbow"]
+                                ]
+                                color_buttons += [
+                                    dict(label=label, method="restyle",
+                                         args=[{"colorscale": [[[0, color], [1, color]]], "showscale": [False]}])
+                                    for label, color in [("Solid Blue", "royalblue"), ("Solid Green", "mediumseagreen")]
+                                ]
+                                opacity_steps = [
+                                    dict(label=f"{step / 10:.1f}", method="restyle", args=[{"opacity": [step / 10]}])
+                                    for step in range(1, 11)
+                                ]
+                                fig.update_layout(
+                                    updatemenus=[dict(buttons=color_buttons, direction="down",
+                                                      x=0, y=1, xanchor="left", yanchor="top")],
+                                    sliders=[dict(steps=opacity_steps, active=round(fig.data[0].opacity * 10) - 1,
+                                                  currentvalue=dict(prefix="Opacity: "), x=0, y=0, len=0.5)],
+                                )
                                 
                                 # Display the plot in Streamlit with a good height for better visualization
                                 st.plotly_chart(fig, use_container_width=True, height=600)
                                 
                                 # Add a download button for the 3D model file
-                                with open(selected_model_path, "rb") as file:
-                                    st.download_button(
-                                        label=f"Download {file_ext[1:].upper()} file",
-                                        data=file,
-                                        file_name=os.path.basename(selected_model_path),
-                                        mime="application/octet-stream"
-                                    )
+                                st.download_button(
+                                    label=f"Download {file_ext[1:].upper()} file",
+                                    data=data_bytes,
+                                    file_name=os.path.basename(selected_model_path),
+                                    mime="application/octet-stream"
+                                )
                             except Exception as e:
                                 st.error(f"Error loading 3D model file: {str(e)}")
                     else:
@@ -842,20 +1235,22 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                 # Show the gallery view
                 st.write("### 3D Model Browser")
                 
-                # Add search functionality
-                search_query = st.text_input("🔍 Search models by name, ID or description", "").lower()
+                # Add search functionality. Inside a form, typing doesn't rerun the script; the
+                # gallery is filtered only when the search is submitted
+                with st.form("search_form", clear_on_submit=False):
+                    search_query = st.text_input("🔍 Search models by name, ID or description", "").lower()
+                    st.form_submit_button("Search")
                 
                 # For each category, display its models
-                for category in sorted(categories):
-                    category_path = os.path.join(downloads_dir, category)
-                    
+                sorted_categories = sorted(categories)
+                first_category = sorted_categories[0]
+                for category in sorted_categories:
                     # Get all models in this category
-                    model_dirs = [d for d in os.listdir(category_path) 
-                                if os.path.isdir(os.path.join(category_path, d))]
+                    model_dirs = downloads_index.get(category, [])
                     
                     if model_dirs:
                         # Add separator between categories (except for the first one)
-                        if category != sorted(categories)[0]:
+                        if category != first_category:
                             st.markdown("---")
                             
                         # Create a header for each category with a bit of styling
@@ -863,34 +1258,15 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                         
                         # Create a container for this category's models
                         with st.container():
-                            # Collect model information for this category
-                            category_models = []
-                            for model_name in model_dirs:
-                                model_path = os.path.join(category_path, model_name)
-                                model_info = get_model_info(model_path, model_name)
-                                # Add category to model info
-                                model_info['category'] = category
-                                
-                                # Filter models based on search query if provided
-                                if search_query:
-                                    # Check if search query is in the model name, id, or readme content
-                                    model_matches = False
-                                    # Check name
-                                    if search_query in model_info['name'].lower():
-                                        model_matches = True
-                                    # Check thing_id
-                                    elif model_info['thing_id'] and search_query in model_info['thing_id'].lower():
-                                        model_matches = True
-                                    # Check readme content
-                                    elif model_info['readme_content'] and search_query in model_info['readme_content'].lower():
-                                        model_matches = True
-                                    
-                                    # Only add if it matches the search
-                                    if model_matches:
-                                        category_models.append(model_info)
-                                else:
-                                    # No search query, add all models
-                                    category_models.append(model_info)
+                            # Collect this category's models, filtered by the search query if provided
+                            category_models = [
+                                model_info
+                                for model_info in (get_model_info(model_path, model_name, mtime, category)
+                                                   for model_name, model_path, _, _, mtime in model_dirs
+                                                   # The index is cached; skip models deleted since
+                                                   if os.path.isdir(model_path))
+                                if not search_query or search_query in model_info['search_text']
+                            ]
                             
                             # Display models in a grid layout
                             cols = st.columns(3)  # Create 3 columns for the gallery
@@ -900,7 +1276,7 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                                     # Create a card-like display for each model
                                     with st.container():
                                         # Show thumbnail if available, otherwise show placeholder
-                                        if model['thumbnail_path'] and os.path.exists(model['thumbnail_path']):
+                                        if model['thumbnail_path']:
                                             st.image(model['thumbnail_path'], use_column_width=True)
                                         else:
                                             # Display a placeholder for models without thumbnails
@@ -912,10 +1288,10 @@ def browser_page(downloads_dir, selected_model_name=None, selected_category=None
                                                 unsafe_allow_html=True
                                             )
                                         
-                                        # Display model name and basic info
-                                        st.write(f"**{model['name']}**")
-                                        st.write(f"3D Model Files: {model['model_count']}")
-                                        st.write(f"Category: {model['category']}")
+                                        # Display model name and basic info as one element rather than three
+                                        st.markdown(f"**{model['name']}**  \n"
+                                                    f"3D Model Files: {model['model_count']}  \n"
+                                                    f"Category: {model['category']}")
                                         
                                         # Add a button to view details
                                         if st.button(f"View Details", key=f"view_details_{category}_{i}"):
@@ -974,48 +1350,47 @@ def main():
                     # Create a JSON export of the collection structure
                     export_data = {"categories": {}}
                     
-                    if os.path.exists(downloads_dir):
-                        for category in os.listdir(downloads_dir):
-                            category_path = os.path.join(downloads_dir, category)
-                            if os.path.isdir(category_path):
-                                export_data["categories"][category] = []
-                                
-                                for model in os.listdir(category_path):
-                                    model_path = os.path.join(category_path, model)
-                                    if os.path.isdir(model_path):
-                                        # Get model info
-                                        model_info = get_model_info(model_path, model)
-                                        export_data["categories"][category].append({
-                                            "name": model,
-                                            "thing_id": model_info.get("thing_id", ""),
-                                            "model_count": model_info.get("model_count", 0),
-                                            "path": model_path,
-                                            "download_date": model_info.get("download_date", ""),
-                                        })
+                    for category, models in scan_downloads(downloads_dir).items():
+                        export_data["categories"][category] = []
+                        
+                        for model, model_path, _, _, mtime in models:
+                            # Get model info
+                            model_info = get_model_info(model_path, model, mtime, category)
+                            export_data["categories"][category].append({
+                                "name": model,
+                                "thing_id": model_info.get("thing_id", ""),
+                                "model_count": model_info.get("model_count", 0),
+                                "path": model_path,
+                                "download_date": model_info.get("download_date", ""),
+                            })
                     
-                    # Create a download link
+                    # Create a download button for the compressed export; serving the bytes
+                    # directly avoids inlining a base64 data URI into the page
+                    import gzip
                     import json
-                    import base64
                     from datetime import datetime
                     
-                    export_str = json.dumps(export_data, indent=2)
-                    b64 = base64.b64encode(export_str.encode()).decode()
+                    payload = gzip.compress(json.dumps(export_data, indent=2).encode())
                     date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"thingiverse_collection_{date_str}.json"
-                    href = f'<a href="data:application/json;base64,{b64}" download="{filename}">Download Export File</a>'
-                    st.markdown(href, unsafe_allow_html=True)
+                    filename = f"thingiverse_collection_{date_str}.json.gz"
+                    st.download_button("Download Export File", data=payload,
+                                       file_name=filename, mime="application/gzip")
                     st.success("Export file ready for download!")
                 except Exception as e:
                     st.error(f"Error exporting collection: {str(e)}")
                     
         with col2:
             # Import button
-            uploaded_file = st.file_uploader("Import", type="json")
+            uploaded_file = st.file_uploader("Import", type=["json", "gz"])
             if uploaded_file is not None:
                 try:
+                    import gzip
                     import json
-                    # Load and validate the file
-                    import_data = json.loads(uploaded_file.read())
+                    # Load and validate the file; exports are gzip-compressed JSON
+                    import_bytes = uploaded_file.read()
+                    if import_bytes[:2] == b"\x1f\x8b":
+                        import_bytes = gzip.decompress(import_bytes)
+                    import_data = json.loads(import_bytes)
                     
                     if "categories" not in import_data:
                         st.error("Invalid import file format.")
@@ -1037,22 +1412,11 @@ def main():
     st.sidebar.subheader("App Statistics")
     # Calculate app statistics if the downloads directory exists
     if os.path.exists(downloads_dir):
-        # Count categories, models, and estimate storage
-        categories = [d for d in os.listdir(downloads_dir) if os.path.isdir(os.path.join(downloads_dir, d))]
-        model_count = 0
-        total_size = 0
-        for category in categories:
-            category_path = os.path.join(downloads_dir, category)
-            models = [d for d in os.listdir(category_path) if os.path.isdir(os.path.join(category_path, d))]
-            model_count += len(models)
-            
-            # Calculate directory size
-            for root, dirs, files in os.walk(category_path):
-                for file in files:
-                    try:
-                        total_size += os.path.getsize(os.path.join(root, file))
-                    except (FileNotFoundError, PermissionError):
-                        pass
+        # Count categories, models, and estimate storage from the cached index
+        categories = scan_downloads(downloads_dir)
+        model_count = sum(len(models) for models in categories.values())
+        total_size = sum(total_bytes for models in categories.values()
+                         for _, _, _, total_bytes, _ in models)
         
         # Display statistics
         st.sidebar.info(f"📊 **Statistics**\n\n"
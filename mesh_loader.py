@@ -0,0 +1,88 @@
+"""Mesh loading for the 3D preview.
+
+Loading and decimation run in the app's process pool. They live in their own module so
+that worker processes can import them by name: Streamlit re-creates the app script's
+``__main__`` module on every run, so functions defined there can't be pickled reliably.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def decimate_mesh(vertices: np.ndarray, faces: np.ndarray, target_faces: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce an indexed mesh to a target number of triangles.
+    
+    Uses quadric edge collapse from pymeshlab; if that fails, a random subset of
+    the faces is kept instead so the preview still renders.
+    
+    Args:
+        vertices (np.ndarray): (N, 3) vertex coordinates
+        faces (np.ndarray): (M, 3) triangle vertex indices
+        target_faces (int): Number of triangles to reduce the mesh to
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (vertices, faces) arrays of the reduced mesh
+    """
+    try:
+        import pymeshlab
+
+        mesh_set = pymeshlab.MeshSet()
+        mesh_set.add_mesh(pymeshlab.Mesh(vertex_matrix=np.asarray(vertices, dtype=np.float64),
+                                         face_matrix=np.asarray(faces, dtype=np.int32)))
+        mesh_set.meshing_decimation_quadric_edge_collapse(targetfacenum=target_faces, preservenormal=True)
+        reduced = mesh_set.current_mesh()
+        return reduced.vertex_matrix(), reduced.face_matrix()
+    except Exception:
+        # A fixed seed keeps the sampled preview stable between reruns
+        keep = np.random.default_rng(0).choice(len(faces), target_faces, replace=False)
+        # Drop the vertices no kept face uses and renumber the faces, so the vertex data
+        # shrinks along with the triangles
+        used, remapped = np.unique(faces[np.sort(keep)], return_inverse=True)
+        return vertices[used], remapped.reshape(-1, 3)
+
+def _center_and_scale(vertices: np.ndarray, size: float = 100.0) -> np.ndarray:
+    """Center vertices on their bounding box and scale the largest extent to size, in place.
+    
+    The bounding-box center is cheaper than trimesh's area-weighted center of mass and
+    just as good for framing a preview.
+    """
+    lower = vertices.min(axis=0)
+    upper = vertices.max(axis=0)
+    vertices -= (lower + upper) * 0.5
+    vertices *= size / (upper - lower).max()
+    return vertices
+
+def load_mesh(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Load a mesh with trimesh, centered and scaled for display.
+    
+    Args:
+        path (str): Path to the mesh file
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (vertices, faces) as float32 coordinates and int32
+            triangle vertex indices
+    """
+    import trimesh
+
+    tm_mesh = trimesh.load(path)
+    # Single precision halves the data Plotly has to serialize and is plenty for display
+    vertices = _center_and_scale(tm_mesh.vertices.astype(np.float32))
+    return vertices, tm_mesh.faces.astype(np.int32, copy=False)
+
+def plot_arrays(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Split a mesh into the per-axis arrays Plotly's Mesh3d takes.
+    
+    Args:
+        vertices (np.ndarray): (N, 3) vertex coordinates
+        faces (np.ndarray): (M, 3) triangle vertex indices
+        
+    Returns:
+        Tuple[np.ndarray, ...]: (x, y, z, i, j, k, intensity) vertex coordinates, triangle
+            indices and per-vertex height normalized to [0, 1] for coloring
+    """
+    vertices = vertices.astype(np.float32, copy=False)
+    faces = faces.astype(np.int32, copy=False)
+    x, y, z = vertices[:, 0], vertices[:, 1], vertices[:, 2]
+    # Precompute the height-based coloring so Plotly doesn't have to autoscale it each render
+    intensity = ((z - z.min()) / (np.ptp(z) + 1e-9)).astype(np.float32, copy=False)
+    return x, y, z, faces[:, 0], faces[:, 1], faces[:, 2], intensity